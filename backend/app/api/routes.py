@@ -1,12 +1,18 @@
 """
 API routes for Ground Control Hub
 """
-import json
+import asyncio
 import logging
+import os
+import re
+import time
 from datetime import datetime
-from typing import List, Dict, Optional
+from pathlib import Path
+from typing import List, Dict, Optional, Set
 
-from fastapi import APIRouter, HTTPException, WebSocket, WebSocketDisconnect
+import aiofiles
+import orjson
+from fastapi import APIRouter, HTTPException, Response, WebSocket, WebSocketDisconnect
 
 from ..core.config import settings
 from ..models.device import (
@@ -14,24 +20,70 @@ from ..models.device import (
     SensorReading
 )
 from ..services.serial_service import serial_service
-from ..websockets.websocket_manager import lora_websocket_manager, websocket_lora_terminal_enhanced
+from ..websockets.websocket_manager import epoch_ms, lora_websocket_manager, websocket_lora_terminal_enhanced
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
 # WebSocket connections for real-time updates (telemetry)
-active_connections: List[WebSocket] = []
+active_connections: Set[WebSocket] = set()
+
+# (epoch second, formatted date/time) of the last timestamp produced
+_iso_second_cache = (0, "")
+
+
+def _now_iso() -> str:
+    """Current local time in ISO-8601, re-formatting the date part once per second"""
+    global _iso_second_cache
+    now = time.time()
+    second = int(now)
+    cached_second, prefix = _iso_second_cache
+    if second != cached_second:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(second))
+        _iso_second_cache = (second, prefix)
+    return f"{prefix}.{int((now - second) * 1_000_000):06d}"
+
+
+# Directories already created during this process lifetime
+_ensured_dirs: Set[Path] = set()
+
+
+def _ensure_dir(path: Path):
+    """Create a directory once per process instead of on every request"""
+    if path not in _ensured_dirs:
+        path.mkdir(parents=True, exist_ok=True)
+        _ensured_dirs.add(path)
+
+
+# Case-insensitive response markers, matched without upper-casing a copy
+_HAS_SUCCESS = re.compile("SUCCESS", re.IGNORECASE).search
+_HAS_OK = re.compile("OK", re.IGNORECASE).search
+
+# Plain file names only: no path or drive separators, control characters
+# or leading dot (which also rules out "." and "..")
+_SAFE_CONFIG_NAME = re.compile(r"[^\x00-\x1f/\\:.][^\x00-\x1f/\\:]*")
+
+
+def _is_safe_config_name(filename: str) -> bool:
+    """True if the name cannot escape the configs directory"""
+    return _SAFE_CONFIG_NAME.fullmatch(filename) is not None
+
+
+def _check_config_name(filename: str):
+    """Reject config names that could escape the configs directory"""
+    if not _is_safe_config_name(filename):
+        raise HTTPException(status_code=400, detail="Invalid configuration file name")
 
 
 # Routes for device management
 @router.get("/devices/scan", response_model=Dict[str, List[str]])
-async def scan_devices():
-    """Scan for available devices"""
+async def scan_devices(refresh: bool = False):
+    """Scan for available devices; refresh bypasses the short-lived scan cache"""
     try:
-        devices = serial_service.find_devices()
+        devices = await asyncio.to_thread(serial_service.find_devices, refresh)
         return devices
     except Exception as e:
-        logger.error(f"Error scanning devices: {e}")
+        logger.error("Error scanning devices: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -39,12 +91,12 @@ async def scan_devices():
 async def write_device_config(config: DeviceConfig):
     """Write configuration to device"""
     try:
-        success = serial_service.write_device_config(config)
+        success = await serial_service.run_on_port(False, serial_service.write_device_config, config)
         if not success:
             raise HTTPException(status_code=500, detail="Failed to write configuration")
         return {"status": "success", "message": "Configuration written successfully"}
     except Exception as e:
-        logger.error(f"Error writing device config: {e}")
+        logger.error("Error writing device config: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -52,17 +104,24 @@ async def write_device_config(config: DeviceConfig):
 async def load_config_file(filename: str):
     """Load configuration from file"""
     try:
-        config_path = settings.gch_directory / "configs" / f"{filename}{settings.config_extension}"
-        if not config_path.exists():
-            raise HTTPException(status_code=404, detail="Configuration file not found")
+        _check_config_name(filename)
+        config_path = settings.configs_dir / f"{filename}{settings.config_extension}"
 
-        with open(config_path, 'r') as f:
-            config_data = json.load(f)
+        # Single open instead of exists() + open(), which also avoids the race
+        try:
+            async with aiofiles.open(config_path, 'rb') as f:
+                config_data = await f.read()
+        except FileNotFoundError:
+            raise HTTPException(status_code=404, detail="Configuration file not found")
 
-        config = DeviceConfig(**config_data)
-        return config
+        # Parse and validate in one pass (fills defaults for hand-edited files),
+        # then return the JSON as-is instead of letting FastAPI re-encode it
+        config = DeviceConfig.model_validate_json(config_data)
+        return Response(content=config.model_dump_json(), media_type="application/json")
+    except HTTPException:
+        raise
     except Exception as e:
-        logger.error(f"Error loading config file: {e}")
+        logger.error("Error loading config file: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -70,15 +129,18 @@ async def load_config_file(filename: str):
 async def save_config_file(filename: str, config: DeviceConfig):
     """Save configuration to file"""
     try:
-        config_path = settings.gch_directory / "configs" / f"{filename}{settings.config_extension}"
-        config_path.parent.mkdir(parents=True, exist_ok=True)
+        _check_config_name(filename)
+        config_path = settings.configs_dir / f"{filename}{settings.config_extension}"
+        _ensure_dir(config_path.parent)
 
-        with open(config_path, 'w') as f:
-            json.dump(config.model_dump(), f, indent=2, default=str)
+        async with aiofiles.open(config_path, 'wb') as f:
+            await f.write(orjson.dumps(config.model_dump(), option=orjson.OPT_INDENT_2))
 
         return {"status": "success", "path": str(config_path)}
+    except HTTPException:
+        raise
     except Exception as e:
-        logger.error(f"Error saving config file: {e}")
+        logger.error("Error saving config file: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -86,21 +148,28 @@ async def save_config_file(filename: str, config: DeviceConfig):
 async def list_config_files():
     """List available configuration files"""
     try:
-        config_dir = settings.gch_directory / "configs"
-        config_dir.mkdir(parents=True, exist_ok=True)
+        config_dir = settings.configs_dir
+        _ensure_dir(config_dir)
 
+        ext = settings.config_extension
         files = []
-        for file_path in config_dir.glob(f"*{settings.config_extension}"):
-            files.append({
-                "name": file_path.stem,
-                "path": str(file_path),
-                "modified": file_path.stat().st_mtime,
-                "size": file_path.stat().st_size
-            })
+        # DirEntry caches its stat result, so mtime and size cost one syscall
+        with os.scandir(config_dir) as entries:
+            for entry in entries:
+                name = entry.name[:-len(ext)]
+                # Only offer files that load_config_file will accept
+                if entry.name.endswith(ext) and _is_safe_config_name(name) and entry.is_file():
+                    stat = entry.stat()
+                    files.append({
+                        "name": name,
+                        "path": entry.path,
+                        "modified": stat.st_mtime,
+                        "size": stat.st_size
+                    })
 
         return files
     except Exception as e:
-        logger.error(f"Error listing config files: {e}")
+        logger.error("Error listing config files: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -109,7 +178,7 @@ async def list_config_files():
 async def test_takeoff():
     """Execute takeoff test by simulating pressure sensor"""
     try:
-        response = serial_service.send_command("TEST_TAKEOFF")
+        response = await serial_service.run_on_port(False, serial_service.send_command, "TEST_TAKEOFF")
 
         if not response:
             return TestResult(
@@ -118,7 +187,7 @@ async def test_takeoff():
                 message="No response from device"
             )
 
-        status = "OK" if "SUCCESS" in response.upper() else "FAIL"
+        status = "OK" if _HAS_SUCCESS(response) else "FAIL"
 
         return TestResult(
             test_name="takeoff",
@@ -127,7 +196,7 @@ async def test_takeoff():
             details={"response": response}
         )
     except Exception as e:
-        logger.error(f"Error in takeoff test: {e}")
+        logger.error("Error in takeoff test: %s", e)
         return TestResult(
             test_name="takeoff",
             status="ERROR",
@@ -139,13 +208,15 @@ async def test_takeoff():
 async def test_preflight():
     """Execute pre-flight sensor test"""
     try:
-        response = serial_service.send_command("TEST_SENSORS")
+        response = await serial_service.run_on_port(
+            False, serial_service.send_command, "TEST_SENSORS", expect_json=True
+        )
 
         if not response:
             raise HTTPException(status_code=500, detail="No response from device")
 
         try:
-            sensor_data = json.loads(response)
+            sensor_data = orjson.loads(response)
             readings = [
                 SensorReading(
                     sensor_name=sensor_name,
@@ -156,24 +227,24 @@ async def test_preflight():
                 for sensor_name, data in sensor_data.items()
             ]
             return readings
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             readings = []
-            for line in response.split('\n'):
-                if ':' in line:
-                    parts = line.split(':')
-                    sensor_name = parts[0].strip()
-                    status_value = parts[1].strip()
-
-                    readings.append(SensorReading(
-                        sensor_name=sensor_name,
-                        status="OK" if "OK" in status_value else "FAIL",
-                        value=None,
-                        unit=None
-                    ))
+            for line in response.splitlines():
+                sensor_name, sep, status_value = line.partition(':')
+                if not sep:
+                    continue
+
+                # Every field is built locally here, so validation can be skipped
+                readings.append(SensorReading.model_construct(
+                    sensor_name=sensor_name.strip(),
+                    status="OK" if "OK" in status_value else "FAIL",
+                    value=None,
+                    unit=None
+                ))
             return readings
 
     except Exception as e:
-        logger.error(f"Error in pre-flight test: {e}")
+        logger.error("Error in pre-flight test: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -185,7 +256,7 @@ async def send_command(command: str, use_lora: bool = False):
         if use_lora and lora_websocket_manager.is_active():
             await lora_websocket_manager.send_command_notification(command)
 
-        response = serial_service.send_command(command, use_lora)
+        response = await serial_service.run_on_port(use_lora, serial_service.send_command, command, use_lora)
 
         # Send response via WebSocket if LoRa
         if use_lora and lora_websocket_manager.is_active():
@@ -194,17 +265,17 @@ async def send_command(command: str, use_lora: bool = False):
                     "type": "command_response",
                     "command": command,
                     "response": response,
-                    "timestamp": datetime.now().isoformat()
+                    "timestamp": epoch_ms()
                 })
 
         return {
             "command": command,
             "response": response,
-            "timestamp": datetime.now(),
+            "timestamp": _now_iso(),
             "via_lora": use_lora
         }
     except Exception as e:
-        logger.error(f"Error sending command: {e}")
+        logger.error("Error sending command: %s", e)
 
         # Send error via WebSocket if LoRa
         if use_lora and lora_websocket_manager.is_active():
@@ -222,8 +293,8 @@ async def bind_lora_satellite():
         if lora_websocket_manager.is_active():
             await lora_websocket_manager.send_status_update("Starting satellite binding...")
 
-        response = serial_service.send_command("BIND_SATELLITE", use_lora=True)
-        success = response and "OK" in response.upper()
+        response = await serial_service.run_on_port(True, serial_service.send_command, "BIND_SATELLITE", True)
+        success = bool(response and _HAS_OK(response))
 
         # Notify clients of binding result
         if lora_websocket_manager.is_active():
@@ -233,10 +304,10 @@ async def bind_lora_satellite():
         return {
             "success": success,
             "response": response,
-            "timestamp": datetime.now()
+            "timestamp": _now_iso()
         }
     except Exception as e:
-        logger.error(f"Error binding LoRa satellite: {e}")
+        logger.error("Error binding LoRa satellite: %s", e)
 
         # Notify clients of error
         if lora_websocket_manager.is_active():
@@ -254,35 +325,35 @@ async def read_blackbox_via_lora():
         if lora_websocket_manager.is_active():
             await lora_websocket_manager.send_status_update("Starting blackbox data download...")
 
-        response = serial_service.send_command("READ_BLACKBOX", use_lora=True)
+        # Save blackbox data; the whole transfer runs in one worker thread and is
+        # written as it arrives, so the dump is never held in memory as a whole
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        blackbox_path = settings.logs_dir / f"blackbox_{timestamp}.log"
+        _ensure_dir(blackbox_path.parent)
 
-        if not response:
+        data_size = await serial_service.run_on_port(
+            True, serial_service.save_command_output, "READ_BLACKBOX", blackbox_path, True
+        )
+
+        if not data_size:
             error_msg = "Failed to read blackbox - no response"
             if lora_websocket_manager.is_active():
                 await lora_websocket_manager.send_error(error_msg)
             raise HTTPException(status_code=500, detail=error_msg)
 
-        # Save blackbox data
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        blackbox_path = settings.gch_directory / "logs" / f"blackbox_{timestamp}.log"
-        blackbox_path.parent.mkdir(parents=True, exist_ok=True)
-
-        with open(blackbox_path, 'w') as f:
-            f.write(response)
-
         # Notify clients of successful download
-        success_msg = f"Blackbox downloaded: {len(response)} bytes saved to {blackbox_path.name}"
+        success_msg = f"Blackbox downloaded: {data_size} bytes saved to {blackbox_path.name}"
         if lora_websocket_manager.is_active():
             await lora_websocket_manager.send_status_update(success_msg)
 
         return {
             "success": True,
-            "data_size": len(response),
+            "data_size": data_size,
             "file_path": str(blackbox_path),
-            "timestamp": datetime.now()
+            "timestamp": _now_iso()
         }
     except Exception as e:
-        logger.error(f"Error reading blackbox: {e}")
+        logger.error("Error reading blackbox: %s", e)
 
         # Notify clients of error
         if lora_websocket_manager.is_active():
@@ -304,7 +375,7 @@ async def websocket_lora_terminal(websocket: WebSocket):
 async def websocket_telemetry(websocket: WebSocket):
     """WebSocket endpoint for real-time telemetry data"""
     await websocket.accept()
-    active_connections.append(websocket)
+    active_connections.add(websocket)
 
     if not serial_service.is_monitoring:
         serial_service.start_telemetry_monitoring(broadcast_telemetry)
@@ -313,7 +384,7 @@ async def websocket_telemetry(websocket: WebSocket):
         while True:
             await websocket.receive_text()
     except WebSocketDisconnect:
-        active_connections.remove(websocket)
+        active_connections.discard(websocket)
         if not active_connections:
             serial_service.stop_telemetry_monitoring()
 
@@ -323,17 +394,29 @@ async def broadcast_telemetry(telemetry_data: TelemetryData):
     if not active_connections:
         return
 
-    message = telemetry_data.model_dump_json()
-    disconnected = []
+    # Serialize once; send_bytes skips the per-connection UTF-8 encode of send_text
+    payload: bytes = orjson.dumps(telemetry_data.model_dump())
+    # Snapshot so disconnects during the send cannot mutate what we iterate
+    connections = tuple(active_connections)
 
-    for connection in active_connections:
+    # Common case: a single client, no need for gather overhead
+    if len(connections) == 1:
         try:
-            await connection.send_text(message)
-        except:
-            disconnected.append(connection)
+            await connections[0].send_bytes(payload)
+        except Exception:
+            active_connections.discard(connections[0])
+        return
+
+    # Send concurrently so a slow client does not delay the others
+    results = await asyncio.gather(
+        *(connection.send_bytes(payload) for connection in connections),
+        return_exceptions=True
+    )
 
-    for connection in disconnected:
-        active_connections.remove(connection)
+    active_connections.difference_update(
+        connection for connection, result in zip(connections, results)
+        if isinstance(result, Exception)
+    )
 
 
 # File management routes
@@ -341,23 +424,27 @@ async def broadcast_telemetry(telemetry_data: TelemetryData):
 async def list_log_files():
     """List available log files"""
     try:
-        logs_dir = settings.gch_directory / "logs"
-        logs_dir.mkdir(parents=True, exist_ok=True)
+        logs_dir = settings.logs_dir
+        _ensure_dir(logs_dir)
 
+        extensions = settings.supported_log_formats
         files = []
-        for ext in settings.supported_log_formats:
-            for file_path in logs_dir.glob(f"*{ext}"):
-                files.append({
-                    "name": file_path.name,
-                    "path": str(file_path),
-                    "modified": file_path.stat().st_mtime,
-                    "size": file_path.stat().st_size,
-                    "type": ext[1:]
-                })
+        # Single directory pass for all supported extensions
+        with os.scandir(logs_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith(extensions) and entry.is_file():
+                    stat = entry.stat()
+                    files.append({
+                        "name": entry.name,
+                        "path": entry.path,
+                        "modified": stat.st_mtime,
+                        "size": stat.st_size,
+                        "type": os.path.splitext(entry.name)[1][1:]
+                    })
 
         return sorted(files, key=lambda x: x["modified"], reverse=True)
     except Exception as e:
-        logger.error(f"Error listing log files: {e}")
+        logger.error("Error listing log files: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -367,7 +454,7 @@ async def health_check():
     """Health check endpoint"""
     return {
         "status": "healthy",
-        "timestamp": datetime.now(),
+        "timestamp": _now_iso(),
         "version": settings.version
     }
 
@@ -377,9 +464,9 @@ async def connect_device(device_type: str, port: Optional[str] = None):
     """Connect to device or LoRa Link"""
     try:
         if device_type == "device":
-            success = serial_service.connect_device(port)
+            success = await serial_service.run_on_port(False, serial_service.connect_device, port)
         elif device_type == "lora_link":
-            success = serial_service.connect_lora_link(port)
+            success = await serial_service.run_on_port(True, serial_service.connect_lora_link, port)
         else:
             raise HTTPException(status_code=400, detail="Invalid device type")
 
@@ -394,7 +481,7 @@ async def connect_device(device_type: str, port: Optional[str] = None):
 
         return {"status": "connected", "device_type": device_type, "port": port}
     except Exception as e:
-        logger.error(f"Error connecting to {device_type}: {e}")
+        logger.error("Error connecting to %s: %s", device_type, e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -403,9 +490,9 @@ async def disconnect_device(device_type: str):
     """Disconnect from device or LoRa Link"""
     try:
         if device_type == "device":
-            serial_service.disconnect_device()
+            await serial_service.run_on_port(False, serial_service.disconnect_device)
         elif device_type == "lora_link":
-            serial_service.disconnect_lora_link()
+            await serial_service.run_on_port(True, serial_service.disconnect_lora_link)
         else:
             raise HTTPException(status_code=400, detail="Invalid device type")
 
@@ -415,7 +502,7 @@ async def disconnect_device(device_type: str):
 
         return {"status": "disconnected", "device_type": device_type}
     except Exception as e:
-        logger.error(f"Error disconnecting from {device_type}: {e}")
+        logger.error("Error disconnecting from %s: %s", device_type, e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -429,10 +516,10 @@ async def get_device_status():
 async def ping_device(use_lora: bool = False):
     """Ping device to test connectivity"""
     try:
-        success = serial_service.ping_device(use_lora)
-        return {"success": success, "timestamp": datetime.now()}
+        success = await serial_service.run_on_port(use_lora, serial_service.ping_device, use_lora)
+        return {"success": success, "timestamp": _now_iso()}
     except Exception as e:
-        logger.error(f"Error pinging device: {e}")
+        logger.error("Error pinging device: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -441,10 +528,11 @@ async def ping_device(use_lora: bool = False):
 async def read_device_config():
     """Read current device configuration"""
     try:
-        config = serial_service.read_device_config()
+        config = await serial_service.run_on_port(False, serial_service.read_device_config)
         if not config:
             raise HTTPException(status_code=500, detail="Failed to read configuration")
-        return config
+        # Already a validated model: skip response_model re-validation
+        return Response(content=config.model_dump_json(), media_type="application/json")
     except Exception as e:
-        logger.error(f"Error reading device config: {e}")
+        logger.error("Error reading device config: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
@@ -2,13 +2,15 @@
 Configuration settings for Ground Control Hub
 """
 
+import json
+import os
+from dataclasses import dataclass, field, fields
 from pathlib import Path
-from typing import List
+from typing import Any, Dict, Tuple
 
-from pydantic_settings import BaseSettings
 
-
-class Settings(BaseSettings):
+@dataclass(frozen=True, slots=True)
+class Settings:
     """Application settings"""
 
     # Application info
@@ -26,6 +28,9 @@ class Settings(BaseSettings):
     # Serial communication
     serial_timeout: float = 1.0
     serial_baudrate: int = 115200
+    response_timeout: float = 5.0  # Wait for a command reply to start (s)
+    stream_idle_timeout: float = 1.0  # Gap between chunks that ends a streamed reply (s)
+    io_worker_threads: int = 4  # Default executor size (telemetry polling, file I/O, port scans)
 
     # LoRa Link settings
     lora_vid: str = "0483"  # STM32F103 VID
@@ -40,13 +45,59 @@ class Settings(BaseSettings):
     telemetry_update_interval: float = 0.25  # 250ms as per DATA_PERIOD
 
     # File formats
-    supported_log_formats: List[str] = [".log", ".csv", ".bin"]
+    supported_log_formats: Tuple[str, ...] = (".log", ".csv", ".bin")
     config_extension: str = ".gchcfg"
     plot_extension: str = ".gchplot"
 
-    class Config:
-        env_file = ".env"
+    # Derived values, resolved once at construction
+    configs_dir: Path = field(init=False)
+    logs_dir: Path = field(init=False)
+    device_usb_id: Tuple[int, int] = field(init=False)  # (VID, PID) as ints
+    lora_usb_id: Tuple[int, int] = field(init=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "configs_dir", self.gch_directory / "configs")
+        object.__setattr__(self, "logs_dir", self.gch_directory / "logs")
+        object.__setattr__(self, "device_usb_id", (int(self.device_vid, 16), int(self.device_pid, 16)))
+        object.__setattr__(self, "lora_usb_id", (int(self.lora_vid, 16), int(self.lora_pid, 16)))
+
+    @classmethod
+    def from_env(cls, env_file: str = ".env") -> "Settings":
+        """Build settings, overriding defaults from the env file and environment"""
+        overrides = _read_env(env_file)
+        kwargs = {
+            f.name: _coerce(f.type, overrides[f.name])
+            for f in fields(cls)
+            if f.init and f.name in overrides
+        }
+        return cls(**kwargs)
+
+
+def _read_env(env_file: str) -> Dict[str, str]:
+    """Collect KEY=VALUE pairs from the env file, then the process environment"""
+    values: Dict[str, str] = {}
+
+    env_path = Path(env_file)
+    if env_path.is_file():
+        for line in env_path.read_text(encoding="utf-8").splitlines():
+            key, sep, value = line.partition("=")
+            key = key.strip()
+            if not sep or not key or key.startswith("#"):
+                continue
+            values[key.lower()] = value.strip().strip("\"'")
+
+    # Environment variables take precedence over the env file
+    values.update((key.lower(), value) for key, value in os.environ.items())
+    return values
+
+
+def _coerce(field_type: Any, raw: str) -> Any:
+    """Convert a raw string into the declared field type"""
+    if field_type in (str, int, float, Path):
+        return field_type(raw)
+    # Tuple fields are given as JSON lists, e.g. '[".log", ".csv"]'
+    return tuple(json.loads(raw))
 
 
 # Global settings instance
-settings = Settings()
+settings = Settings.from_env()
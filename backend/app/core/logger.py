@@ -4,33 +4,90 @@ Logging configuration for Ground Control Hub
 
 import logging
 import logging.handlers
-from pathlib import Path
-from datetime import datetime
+import os
+import queue
+import time
+from typing import Optional
+
 from ..core.config import settings
 
+# Background listener that performs the actual file/console writes
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def _dated_log_name(default_name: str) -> str:
+    """Rename a rotated gch.log.YYYY-MM-DD to gch.YYYY-MM-DD.log
+
+    Keeps the extension, so rotated logs still show up in /files/logs,
+    and still matches the pattern the handler's backupCount cleanup expects.
+    """
+    base, _, date = default_name.rpartition('.')
+    stem, ext = os.path.splitext(base)
+    return f"{stem}.{date}{ext}"
+
+
+class CachedTimeFormatter(logging.Formatter):
+    """Formatter that runs strftime() at most once per wall-clock second"""
+
+    _last_second = -1
+    _last_text = ""
+
+    def formatTime(self, record, datefmt=None):
+        if datefmt:
+            return super().formatTime(record, datefmt)
+
+        second = int(record.created)
+        if second != self._last_second:
+            self._last_text = time.strftime(self.default_time_format, self.converter(second))
+            self._last_second = second
+        return self.default_msec_format % (self._last_text, record.msecs)
+
 
 def setup_logging():
-    """Configure logging with rotation by date"""
+    """Configure logging with daily rotation
+
+    Loggers only enqueue records; a QueueListener thread writes them out,
+    so hot paths (e.g. the serial monitor loops) never block on log I/O.
+    """
+    global _listener
 
     # Create logs directory
-    log_dir = settings.gch_directory / "logs"
+    log_dir = settings.logs_dir
     log_dir.mkdir(parents=True, exist_ok=True)
 
-    # Log file path with date
-    log_file = log_dir / f"gch_{datetime.now().strftime('%Y-%m-%d')}.log"
+    formatter = CachedTimeFormatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+    # Rolls over at local midnight; the file is opened on the first record
+    file_handler = logging.handlers.TimedRotatingFileHandler(
+        log_dir / settings.log_file,
+        when='midnight',
+        backupCount=7,
+        encoding='utf-8',
+        delay=True
+    )
+    file_handler.namer = _dated_log_name
+    stream_handler = logging.StreamHandler()  # Console output
+    for handler in (file_handler, stream_handler):
+        handler.setFormatter(formatter)
+
+    # Replace a listener left over from a previous call
+    shutdown_logging()
+
+    log_queue = queue.SimpleQueue()
+    _listener = logging.handlers.QueueListener(
+        log_queue, file_handler, stream_handler, respect_handler_level=True
+    )
+    _listener.start()
+
+    # The queue handler only renders the message; the listener's handlers format the line
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter('%(message)s'))
 
     # Configure root logger
     logging.basicConfig(
         level=logging.DEBUG,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.handlers.RotatingFileHandler(
-                log_file,
-                maxBytes=10 * 1024 * 1024,  # 10MB
-                backupCount=5
-            ),
-            logging.StreamHandler()  # Console output
-        ]
+        handlers=[queue_handler],
+        force=True
     )
 
     # Set specific loggers
@@ -40,4 +97,13 @@ def setup_logging():
     logger = logging.getLogger(__name__)
     logger.info("Logging system initialized")
 
-    return logger
\ No newline at end of file
+    return logger
+
+
+def shutdown_logging():
+    """Flush queued records and stop the listener thread"""
+    global _listener
+
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
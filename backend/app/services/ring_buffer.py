@@ -0,0 +1,47 @@
+"""
+Lock-free single-producer / single-consumer ring buffer
+"""
+
+from collections import deque
+from typing import Any, Deque, Optional
+
+
+class SPSCRing:
+    """Fixed-capacity FIFO shared by a producer and a consumer thread
+
+    Backed by a bounded ``deque``: ``append`` and ``popleft`` are single
+    C-level operations under the GIL, so neither side needs a lock, and a
+    push onto a full ring evicts the oldest item in the same O(1) step.
+    """
+
+    def __init__(self, capacity: int = 128):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+
+        self._buf: Deque[Any] = deque(maxlen=capacity)
+
+    @property
+    def capacity(self) -> int:
+        """Maximum number of buffered items"""
+        return self._buf.maxlen
+
+    def push(self, item: Any) -> bool:
+        """Append item (producer side); returns False if the oldest item was dropped"""
+        buf = self._buf
+        evicting = len(buf) == buf.maxlen  # Advisory only; the consumer may pop concurrently
+        buf.append(item)
+        return not evicting
+
+    def pop(self) -> Optional[Any]:
+        """Remove and return the oldest item (consumer side), or None if empty"""
+        try:
+            return self._buf.popleft()
+        except IndexError:
+            return None
+
+    def clear(self):
+        """Discard all buffered items"""
+        self._buf.clear()
+
+    def __len__(self) -> int:
+        return len(self._buf)
@@ -3,22 +3,55 @@ Enhanced Serial communication service for device and LoRa Link communication
 with real-time data streaming capabilities
 """
 
-import json
+import asyncio
+import atexit
+import functools
 import logging
 import queue
+import re
 import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
+from pathlib import Path
 from threading import Thread, Event, Lock
-from typing import Optional, List, Dict, Callable, Any
+from typing import Optional, List, Dict, Callable, Any, Iterator, Tuple, Awaitable, TypeVar
 
+import orjson
 import serial
 import serial.tools.list_ports
+from pydantic import ValidationError
 
 from ..core.config import settings
 from ..models.device import DeviceConfig, TelemetryData, ConnectionInfo, DeviceStatus
+from .ring_buffer import SPSCRing
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Common command completion indicators, matched anywhere in a response line
+_COMPLETION_RE = re.compile(r"OK|ERROR|DONE|FAIL|SUCCESS", re.IGNORECASE)
+
+
+# Top-level keys a telemetry packet may carry
+_TELEMETRY_FIELDS = frozenset(TelemetryData.model_fields)
+
+
+def _is_telemetry_line(line: str) -> bool:
+    """True if a JSON object line is a telemetry packet rather than a command reply
+
+    Telemetry is a flat object of known fields; config and sensor-test
+    replies have other keys or nested objects.
+    """
+    try:
+        data = orjson.loads(line)
+    except orjson.JSONDecodeError:
+        return False
+
+    return (isinstance(data, dict) and data.keys() <= _TELEMETRY_FIELDS
+            and not any(isinstance(value, (dict, list)) for value in data.values()))
+
 
 class EnhancedSerialService:
     """Enhanced serial communication service with real-time streaming"""
@@ -29,54 +62,92 @@ class EnhancedSerialService:
         self.telemetry_callback: Optional[Callable] = None
         self.lora_data_callback: Optional[Callable] = None
 
-        # Monitoring threads and events
+        # Monitoring tasks, threads and events
         self.is_monitoring = False
         self.is_lora_monitoring = False
-        self.monitor_thread: Optional[Thread] = None
+        self.monitor_task: Optional[asyncio.Task] = None
         self.lora_monitor_thread: Optional[Thread] = None
-        self.stop_event = Event()
         self.lora_stop_event = Event()
 
         # Thread-safe data queues for real-time streaming
-        self.lora_data_queue = queue.Queue(maxsize=100)  # Limit queue size
+        # LoRa handoff has one producer (monitor loop) and one consumer (streamer)
+        self.lora_data_queue = SPSCRing(capacity=128)
+        self.lora_data_event = Event()  # Set when new LoRa messages are queued
         self.telemetry_queue = queue.Queue(maxsize=100)
 
         # Locks for thread safety
         self.device_lock = Lock()
         self.lora_lock = Lock()
 
+        # One worker thread per port for blocking calls from the event loop.
+        # Calls on a port are serialized by its lock anyway, and this way a
+        # long LoRa exchange cannot tie up threads needed for USB commands,
+        # telemetry polling or file I/O in the default executor
+        self._port_executors = {
+            False: ThreadPoolExecutor(max_workers=1, thread_name_prefix="gch-usb"),
+            True: ThreadPoolExecutor(max_workers=1, thread_name_prefix="gch-lora"),
+        }
+
+        # Callers queued for lora_lock; the monitor loop backs off while non-zero
+        self.lora_waiters = 0
+        self.lora_waiters_lock = Lock()
+
         # Buffer for incomplete messages
-        self.lora_buffer = ""
-        self.device_buffer = ""
+        self.lora_buffer = bytearray()
+        self.device_buffer = bytearray()
+
+        # Last device scan as (monotonic time, result); see find_devices
+        self._devices_cache: Optional[Tuple[float, Dict[str, List[str]]]] = None
+
+        # Stop threads and close ports before interpreter teardown
+        atexit.register(self._shutdown)
+
+    def find_devices(self, refresh: bool = False) -> Dict[str, List[str]]:
+        """Find available serial devices by VID:PID
+
+        Results are reused for up to a second, since enumerating ports is
+        slow (especially on Windows) and connects/status polls come in bursts.
+        Pass refresh=True to force a new scan, e.g. after a device is plugged in.
+        """
+        cached = self._devices_cache
+        if not refresh and cached and time.monotonic() - cached[0] < 1.0:
+            return {kind: list(ports) for kind, ports in cached[1].items()}
 
-    def find_devices(self) -> Dict[str, List[str]]:
-        """Find available serial devices by VID:PID"""
         devices = {"device": [], "lora_link": []}
 
         try:
+            device_vid, device_pid = settings.device_usb_id
+            lora_vid, lora_pid = settings.lora_usb_id
+
             ports = serial.tools.list_ports.comports()
             for port in ports:
                 if port.vid and port.pid:
-                    vid_pid = f"{port.vid:04X}:{port.pid:04X}"
-                    logger.debug(f"Found device: {port.device} ({vid_pid}) - {port.description}")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(f"Found device: {port.device} "
+                                     f"({port.vid:04X}:{port.pid:04X}) - {port.description}")
 
                     # Check for stratospheric device (STM32F401)
-                    if (f"{port.vid:04X}" == settings.device_vid and
-                            f"{port.pid:04X}" == settings.device_pid):
+                    if port.vid == device_vid and port.pid == device_pid:
                         devices["device"].append(port.device)
                         logger.info(f"Found stratospheric device: {port.device}")
 
                     # Check for LoRa Link (STM32F103)
-                    if (f"{port.vid:04X}" == settings.lora_vid and
-                            f"{port.pid:04X}" == settings.lora_pid):
+                    if port.vid == lora_vid and port.pid == lora_pid:
                         devices["lora_link"].append(port.device)
                         logger.info(f"Found LoRa Link: {port.device}")
 
+            self._devices_cache = (time.monotonic(), devices)
+            devices = {kind: list(ports) for kind, ports in devices.items()}
+
         except Exception as e:
             logger.error(f"Error scanning for devices: {e}")
 
         return devices
 
+    def invalidate_device_cache(self):
+        """Drop the cached port scan so the next find_devices() re-enumerates"""
+        self._devices_cache = None
+
     def connect_device(self, port: Optional[str] = None) -> bool:
         """Connect to stratospheric device"""
         with self.device_lock:
@@ -102,8 +173,9 @@ class EnhancedSerialService:
                 # Clear any existing data in buffers
                 self.device_port.reset_input_buffer()
                 self.device_port.reset_output_buffer()
-                self.device_buffer = ""
+                self.device_buffer.clear()
 
+                self.invalidate_device_cache()  # Port ownership changed
                 logger.info(f"Connected to device on {port}")
                 return True
 
@@ -113,7 +185,7 @@ class EnhancedSerialService:
 
     def connect_lora_link(self, port: Optional[str] = None) -> bool:
         """Connect to LoRa Link module"""
-        with self.lora_lock:
+        with self._port_lock(use_lora=True):
             try:
                 if not port:
                     devices = self.find_devices()
@@ -136,15 +208,12 @@ class EnhancedSerialService:
                 # Clear any existing data in buffers
                 self.lora_port.reset_input_buffer()
                 self.lora_port.reset_output_buffer()
-                self.lora_buffer = ""
+                self.lora_buffer.clear()
 
                 # Clear the queue
-                while not self.lora_data_queue.empty():
-                    try:
-                        self.lora_data_queue.get_nowait()
-                    except queue.Empty:
-                        break
+                self.lora_data_queue.clear()
 
+                self.invalidate_device_cache()  # Port ownership changed
                 logger.info(f"Connected to LoRa Link on {port}")
 
                 # Start LoRa monitoring thread for real-time data
@@ -161,7 +230,7 @@ class EnhancedSerialService:
         with self.device_lock:
             if self.device_port and self.device_port.is_open:
                 self.device_port.close()
-                self.device_buffer = ""
+                self.device_buffer.clear()
                 logger.info("Disconnected from device")
 
     def disconnect_lora_link(self):
@@ -172,16 +241,47 @@ class EnhancedSerialService:
         with self.lora_lock:
             if self.lora_port and self.lora_port.is_open:
                 self.lora_port.close()
-                self.lora_buffer = ""
+                self.lora_buffer.clear()
                 logger.info("Disconnected from LoRa Link")
 
-    def send_command(self, command: str, use_lora: bool = False) -> Optional[str]:
-        """Send command to device or LoRa Link with enhanced response handling"""
+    @contextmanager
+    def _port_lock(self, use_lora: bool):
+        """Hold the lock of the selected port
+
+        The LoRa monitor loop re-takes lora_lock right after each blocking
+        read, so LoRa callers register first to make the loop step aside.
+        """
+        if not use_lora:
+            with self.device_lock:
+                yield
+            return
+
+        with self.lora_waiters_lock:
+            self.lora_waiters += 1
+        with self.lora_lock:
+            with self.lora_waiters_lock:
+                self.lora_waiters -= 1
+            yield
+
+    async def run_on_port(self, use_lora: bool, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run a blocking call on the worker thread of the selected port"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._port_executors[use_lora], functools.partial(func, *args, **kwargs)
+        )
+
+    def send_command(self, command: str, use_lora: bool = False,
+                     expect_json: bool = False) -> Optional[str]:
+        """Send command to device or LoRa Link with enhanced response handling
+
+        With expect_json the first JSON object line that is not a telemetry
+        packet is the whole reply (GET_CONFIG, TEST_SENSORS); otherwise JSON
+        lines are telemetry interleaved with the reply and are skipped.
+        """
         try:
             port = self.lora_port if use_lora else self.device_port
-            lock = self.lora_lock if use_lora else self.device_lock
 
-            with lock:
+            with self._port_lock(use_lora):
                 if not port or not port.is_open:
                     logger.error(f"{'LoRa Link' if use_lora else 'Device'} not connected")
                     return None
@@ -200,36 +300,46 @@ class EnhancedSerialService:
                 if use_lora:
                     return None
 
-                # Wait for response with timeout for direct USB commands
+                # Wait for response with timeout for direct USB commands; read()
+                # blocks in the driver for the first byte, then takes everything
+                # already buffered in the same call
                 response_lines = []
-                start_time = time.time()
-                timeout = 5.0  # 5 second timeout for command responses
-                partial_line = ""
-
-                while time.time() - start_time < timeout:
-                    if port.in_waiting > 0:
-                        chunk = port.read(port.in_waiting).decode('utf-8', errors='ignore')
-                        partial_line += chunk
-
-                        # Process complete lines
-                        while '\n' in partial_line:
-                            line, partial_line = partial_line.split('\n', 1)
-                            line = line.strip()
-                            if line:
-                                response_lines.append(line)
-
-                                # Check for common command completion indicators
-                                if any(indicator in line.upper() for indicator in
-                                       ['OK', 'ERROR', 'DONE', 'FAIL', 'SUCCESS']):
-                                    response = '\n'.join(response_lines)
-                                    logger.debug(f"Command response: {response}")
-                                    return response
-
-                    time.sleep(0.05)  # Small delay to prevent excessive CPU usage
+                deadline = time.monotonic() + settings.response_timeout
+                buf = bytearray()
+                saved_timeout = port.timeout
+                port.timeout = 0.25
+
+                try:
+                    while time.monotonic() < deadline:
+                        buf += port.read(port.in_waiting or 1)
+
+                        while (idx := buf.find(b'\n')) >= 0:
+                            line = buf[:idx].decode('utf-8', errors='ignore').strip()
+                            del buf[:idx + 1]
+                            if not line:
+                                continue
+
+                            if line.startswith('{') and line.endswith('}'):
+                                # Telemetry shares the USB link with command replies
+                                if expect_json and not _is_telemetry_line(line):
+                                    logger.debug(f"Command JSON response: {line}")
+                                    return line
+                                continue
+
+                            response_lines.append(line)
+
+                            # Check for common command completion indicators
+                            if _COMPLETION_RE.search(line):
+                                response = '\n'.join(response_lines)
+                                logger.debug(f"Command response: {response}")
+                                return response
+                finally:
+                    port.timeout = saved_timeout
 
                 # Add any remaining partial line
-                if partial_line.strip():
-                    response_lines.append(partial_line.strip())
+                remainder = buf.decode('utf-8', errors='ignore').strip()
+                if remainder:
+                    response_lines.append(remainder)
 
                 # Return whatever we got if timeout reached
                 response = '\n'.join(response_lines) if response_lines else None
@@ -240,6 +350,65 @@ class EnhancedSerialService:
             logger.error(f"Error sending command '{command}': {e}")
             return None
 
+    def stream_command(self, command: str, use_lora: bool = False,
+                       first_byte_timeout: Optional[float] = None,
+                       idle_timeout: Optional[float] = None) -> Iterator[bytes]:
+        """Send command and yield raw response chunks until the link goes quiet
+
+        The reply gets first_byte_timeout to start (slow over the radio) and
+        ends once no data arrives for idle_timeout; both default to settings.
+        The port lock is held for the whole transfer so the LoRa monitor
+        does not consume the response in the meantime.
+        """
+        if first_byte_timeout is None:
+            first_byte_timeout = settings.response_timeout
+        if idle_timeout is None:
+            idle_timeout = settings.stream_idle_timeout
+
+        port = self.lora_port if use_lora else self.device_port
+
+        with self._port_lock(use_lora):
+            if not port or not port.is_open:
+                logger.error(f"{'LoRa Link' if use_lora else 'Device'} not connected")
+                return
+
+            port.reset_input_buffer()
+            port.write((command + "\n").encode('utf-8'))
+            port.flush()
+
+            logger.info(f"Streaming command: {command} (via {'LoRa' if use_lora else 'USB'})")
+
+            # read() blocks for up to the port timeout waiting for the next byte;
+            # the first one is given longer than the gap between chunks
+            deadline = time.monotonic() + first_byte_timeout
+            while time.monotonic() < deadline:
+                chunk = port.read(port.in_waiting or 1)
+                if chunk:
+                    deadline = time.monotonic() + idle_timeout
+                    yield chunk
+
+    def save_command_output(self, command: str, path: Path, use_lora: bool = False) -> int:
+        """Stream a command's response straight into a file; returns the bytes written
+
+        Call this from a worker thread: the port lock taken by stream_command
+        is then held by that one thread for the whole transfer instead of by
+        a coroutine suspended across awaits. The file is only created once
+        the first chunk arrives.
+        """
+        data_size = 0
+        f = None
+        try:
+            for chunk in self.stream_command(command, use_lora):
+                if f is None:
+                    f = open(path, 'wb')
+                f.write(chunk)
+                data_size += len(chunk)
+        finally:
+            if f is not None:
+                f.close()
+
+        return data_size
+
     def start_lora_monitoring(self):
         """Start monitoring LoRa Link for incoming data"""
         if self.is_lora_monitoring:
@@ -280,31 +449,36 @@ class EnhancedSerialService:
                     time.sleep(0.5)
                     continue
 
-                # Check for incoming data
+                # Let queued command senders take the port first
+                if self.lora_waiters:
+                    time.sleep(0.001)
+                    continue
+
                 try:
-                    if self.lora_port.in_waiting > 0:
-                        with self.lora_lock:
-                            # Read available data with timeout
-                            raw_data = self.lora_port.read(
-                                min(self.lora_port.in_waiting, 1024)  # Limit read size
-                            ).decode('utf-8', errors='ignore')
-
-                            if raw_data:
-                                logger.debug(f"Received raw LoRa data: {repr(raw_data)}")
-                                # Add to buffer and process complete lines
-                                self.lora_buffer += raw_data
-                                self._process_lora_buffer()
+                    with self.lora_lock:
+                        # With nothing buffered this waits in the driver for the
+                        # first byte (up to the 0.1 s port timeout) instead of polling.
+                        # The lock stays held so stream_command's reply is never
+                        # consumed here; LoRa callers wait for it on their port
+                        # worker (run_on_port), never on the event loop
+                        raw_data = self.lora_port.read(
+                            min(self.lora_port.in_waiting, 1024) or 1  # Limit read size
+                        )
+
+                        if raw_data:
+                            logger.debug(f"Received raw LoRa data: {repr(raw_data)}")
+                            # Add to buffer and process complete lines
+                            self.lora_buffer.extend(raw_data)
+                            self._process_lora_buffer()
 
                 except serial.SerialException as e:
                     logger.error(f"Serial error in LoRa monitoring: {e}")
+                    self.invalidate_device_cache()  # The link may have been unplugged
                     time.sleep(1.0)
                     continue
                 except Exception as e:
                     logger.error(f"Error reading LoRa data: {e}")
 
-                # Small delay to prevent excessive CPU usage
-                time.sleep(0.01)
-
             except Exception as e:
                 logger.error(f"Error in LoRa monitoring loop: {e}")
                 time.sleep(1.0)
@@ -315,63 +489,69 @@ class EnhancedSerialService:
         """Process buffered LoRa data and extract complete messages"""
         processed_lines = 0
         max_lines_per_process = 10  # Prevent processing too many lines at once
-
-        while '\n' in self.lora_buffer and processed_lines < max_lines_per_process:
-            line, self.lora_buffer = self.lora_buffer.split('\n', 1)
-            line = line.strip()
+        queued = False
+        dropped = 0
+
+        # Lines are cut out of the byte buffer in place and only decoded once complete
+        buf = self.lora_buffer
+        while processed_lines < max_lines_per_process:
+            idx = buf.find(b'\n')
+            if idx < 0:
+                break
+
+            line = buf[:idx].decode('utf-8', errors='ignore').strip()
+            del buf[:idx + 1]
             processed_lines += 1
 
             if line:  # Only process non-empty lines
                 data_item = {
                     'type': 'terminal_output',
                     'content': line,
-                    'timestamp': datetime.now().isoformat()
+                    'timestamp': time.time_ns() // 1_000_000  # Epoch ms, as epoch_ms()
                 }
                 logger.debug(f"Processing LoRa line: '{line}'")
 
-                # Add to queue for processing
-                try:
-                    self.lora_data_queue.put(data_item, block=False)
+                # Add to queue for processing; a full ring evicts the oldest message
+                if self.lora_data_queue.push(data_item):
                     logger.debug(f"Successfully added to LoRa queue: {data_item}")
-                except queue.Full:
-                    # Queue is full, remove oldest items to make space
-                    try:
-                        # Remove up to 5 old items to make space
-                        for _ in range(5):
-                            removed_item = self.lora_data_queue.get_nowait()
-                            logger.debug(f"Removed old item from full queue: {removed_item}")
-
-                        # Try to add the new item again
-                        self.lora_data_queue.put(data_item, block=False)
-                        logger.debug(f"Added to LoRa queue after cleanup: {data_item}")
-                    except queue.Empty:
-                        # Queue became empty, try to add directly
-                        try:
-                            self.lora_data_queue.put(data_item, block=False)
-                        except queue.Full:
-                            logger.warning("LoRa queue is still full after cleanup, dropping message")
-                    except Exception as e:
-                        logger.error(f"Error managing LoRa queue: {e}")
+                else:
+                    dropped += 1
+                queued = True
+
+        # Evicting the oldest lines is the normal overflow path, so it is
+        # reported once per processed chunk and only at debug level
+        if dropped:
+            logger.debug(f"LoRa queue is full, dropped {dropped} oldest message(s)")
+
+        # One wakeup per processed chunk rather than per line
+        if queued:
+            self.lora_data_event.set()
 
     def get_lora_data(self) -> Optional[Dict[str, Any]]:
         """Get next available LoRa data from queue (non-blocking)"""
-        try:
-            data = self.lora_data_queue.get_nowait()
+        data = self.lora_data_queue.pop()
+        if data is not None:
             logger.debug(f"Retrieved LoRa data from queue: {data}")
-            return data
-        except queue.Empty:
-            return None
+        return data
+
+    def wait_for_lora_data(self, timeout: float) -> bool:
+        """Block until LoRa data is queued or timeout expires; True if data is available"""
+        if self.lora_data_event.wait(timeout):
+            # Cleared before the caller drains, so a later push re-arms it
+            self.lora_data_event.clear()
+        return self.has_lora_data()
+
+    def wake_lora_consumer(self):
+        """Return a pending wait_for_lora_data() call early, e.g. to stop its thread"""
+        self.lora_data_event.set()
 
     def has_lora_data(self) -> bool:
         """Check if LoRa data is available"""
-        result = not self.lora_data_queue.empty()
-        if result:
-            logger.debug(f"LoRa data available, queue size: {self.lora_data_queue.qsize()}")
-        return result
+        return len(self.lora_data_queue) > 0
 
     def get_queue_size(self) -> int:
         """Get current queue size for debugging"""
-        return self.lora_data_queue.qsize()
+        return len(self.lora_data_queue)
 
     def set_lora_data_callback(self, callback: Callable[[Dict[str, Any]], None]):
         """Set callback for LoRa data updates"""
@@ -385,15 +565,14 @@ class EnhancedSerialService:
                 return None
 
             # Send configuration read command
-            response = self.send_command("GET_CONFIG")
+            response = self.send_command("GET_CONFIG", expect_json=True)
             if not response:
                 return None
 
             # Parse JSON response
             try:
-                config_data = json.loads(response)
-                return DeviceConfig(**config_data)
-            except json.JSONDecodeError:
+                return DeviceConfig.model_validate_json(response)
+            except ValidationError:
                 logger.error("Failed to parse device configuration")
                 return None
 
@@ -422,71 +601,96 @@ class EnhancedSerialService:
             logger.error(f"Error writing device config: {e}")
             return False
 
-    def start_telemetry_monitoring(self, callback: Callable[[TelemetryData], None]):
-        """Start monitoring telemetry data"""
+    def start_telemetry_monitoring(self, callback: Callable[[TelemetryData], Awaitable[None]]):
+        """Start monitoring telemetry data
+
+        Must be called from the event loop: monitoring runs as a task on it,
+        so the async callback is awaited there directly.
+        """
         self.telemetry_callback = callback
         self.is_monitoring = True
-        self.stop_event.clear()
 
-        self.monitor_thread = Thread(
-            target=self._telemetry_monitor_loop,
-            daemon=True,
+        self.monitor_task = asyncio.get_running_loop().create_task(
+            self._telemetry_monitor_loop(),
             name="TelemetryMonitor"
         )
-        self.monitor_thread.start()
 
         logger.info("Started telemetry monitoring")
 
     def stop_telemetry_monitoring(self):
         """Stop monitoring telemetry data"""
+        if not self.is_monitoring:
+            return
+
         self.is_monitoring = False
-        self.stop_event.set()
 
-        if self.monitor_thread and self.monitor_thread.is_alive():
-            self.monitor_thread.join(timeout=2.0)
+        # Already finished if the event loop has shut down
+        if self.monitor_task and not self.monitor_task.done():
+            self.monitor_task.cancel()
 
         logger.info("Stopped telemetry monitoring")
 
-    def _telemetry_monitor_loop(self):
-        """Background loop for telemetry monitoring"""
-        while self.is_monitoring and not self.stop_event.is_set():
+    async def _telemetry_monitor_loop(self):
+        """Event loop task for telemetry monitoring"""
+        while self.is_monitoring:
             try:
-                # Try to read from device first, then LoRa Link
-                data = None
-
-                if self.device_port and self.device_port.is_open:
-                    data = self._read_telemetry_data(self.device_port)
-                elif self.lora_port and self.lora_port.is_open:
-                    data = self._read_telemetry_data(self.lora_port)
+                # Serial reads block, so they run in the default executor
+                data = await asyncio.to_thread(self._poll_telemetry)
 
                 if data and self.telemetry_callback:
-                    self.telemetry_callback(data)
+                    await self.telemetry_callback(data)
 
                 # Wait for next update cycle
-                time.sleep(settings.telemetry_update_interval)
+                await asyncio.sleep(settings.telemetry_update_interval)
 
+            except asyncio.CancelledError:
+                raise
             except Exception as e:
                 logger.error(f"Error in telemetry monitoring: {e}")
-                time.sleep(1.0)
+                await asyncio.sleep(1.0)
+
+    def _poll_telemetry(self) -> Optional[TelemetryData]:
+        """Read telemetry from the device first, then the LoRa Link"""
+        if self.device_port and self.device_port.is_open:
+            return self._read_telemetry_data(self.device_port)
+        if self.lora_port and self.lora_port.is_open:
+            return self._read_telemetry_data(self.lora_port)
+        return None
 
     def _read_telemetry_data(self, port: serial.Serial) -> Optional[TelemetryData]:
-        """Read and parse telemetry data from serial port"""
+        """Read and parse telemetry data from serial port
+
+        Bytes accumulate in device_buffer so a packet split across reads is
+        kept for the next call; of the complete lines, the newest valid
+        packet wins.
+        """
         try:
             if port.in_waiting == 0:
                 return None
 
-            # Read available data
-            raw_data = port.read(port.in_waiting).decode('utf-8', errors='ignore')
+            buf = self.device_buffer
+            buf += port.read(port.in_waiting)
+
+            end = buf.rfind(b'\n')
+            if end < 0:
+                if len(buf) > 65536:  # No line framing at all; don't grow forever
+                    buf.clear()
+                return None
+
+            lines = buf[:end].split(b'\n')
+            del buf[:end + 1]
+
+            # Look for complete JSON telemetry packets, newest first
+            for line in reversed(lines):
+                # Reject device log noise before paying for a strip() copy
+                if b'{' not in line:
+                    continue
 
-            # Look for complete JSON telemetry packets
-            lines = raw_data.split('\n')
-            for line in lines:
                 line = line.strip()
-                if line.startswith('{') and line.endswith('}'):
+                if line.startswith(b'{') and line.endswith(b'}'):
                     try:
-                        telemetry_dict = json.loads(line)
-                        return TelemetryData(**telemetry_dict)
-                    except (json.JSONDecodeError, ValueError):
+                        return TelemetryData.model_validate_json(line)
+                    except ValueError:
                         continue
 
             return None
@@ -534,12 +738,14 @@ class EnhancedSerialService:
             "out_waiting": str(port.out_waiting) if hasattr(port, 'out_waiting') else "N/A"
         }
 
-    def __del__(self):
-        """Cleanup on destruction"""
+    def _shutdown(self):
+        """Cleanup at interpreter exit"""
         self.stop_telemetry_monitoring()
         self.stop_lora_monitoring()
         self.disconnect_device()
         self.disconnect_lora_link()
+        for executor in self._port_executors.values():
+            executor.shutdown(wait=False, cancel_futures=True)
 
 
 # Global enhanced serial service instance
@@ -4,13 +4,12 @@ WebSocket manager for handling real-time LoRa Link communications
 
 import asyncio
 import concurrent.futures
-import json
 import logging
 import time
-from datetime import datetime
 from threading import Thread, Event
-from typing import Set, Dict, Any, Optional
+from typing import Set, Dict, Any, Optional, Union
 
+import orjson
 from fastapi import WebSocket, WebSocketDisconnect
 
 from ..services.serial_service import serial_service
@@ -18,11 +17,24 @@ from ..services.serial_service import serial_service
 logger = logging.getLogger(__name__)
 
 
+def epoch_ms() -> int:
+    """Current time as Unix epoch milliseconds (JS Date-compatible, unlike ns)"""
+    return time.time_ns() // 1_000_000
+
+
+# Pre-encoded frames whose only variable field is the integer timestamp
+_PONG_FRAME = b'{"type":"pong","timestamp":%d}'
+_KEEPALIVE_FRAME = b'{"type":"info","timestamp":%d}'
+
+
 class LoRaWebSocketManager:
     """Manager for LoRa Link WebSocket connections and real-time data streaming"""
 
     def __init__(self):
         self.active_connections: Set[WebSocket] = set()
+        # Per-connection outgoing frame queues, each drained by its own sender task
+        self._send_queues: Dict[WebSocket, asyncio.Queue] = {}
+        self._senders: Dict[WebSocket, asyncio.Task] = {}
         self.is_streaming = False
         self.stream_thread: Optional[Thread] = None
         self.stop_event = Event()
@@ -34,6 +46,12 @@ class LoRaWebSocketManager:
         await websocket.accept()
         self.active_connections.add(websocket)
 
+        queue: asyncio.Queue = asyncio.Queue(maxsize=256)
+        self._send_queues[websocket] = queue
+        self._senders[websocket] = asyncio.create_task(
+            self._sender(websocket, queue), name="LoRaWebSocketSender"
+        )
+
         # Store the main event loop
         if self._main_loop is None:
             self._main_loop = asyncio.get_event_loop()
@@ -42,7 +60,7 @@ class LoRaWebSocketManager:
         await self.send_to_client(websocket, {
             "type": "status",
             "message": "LoRa terminal WebSocket connected",
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": epoch_ms(),
             "connection_count": len(self.active_connections)
         })
 
@@ -54,7 +72,14 @@ class LoRaWebSocketManager:
 
     def disconnect(self, websocket: WebSocket):
         """Handle WebSocket disconnection"""
+        if websocket not in self.active_connections:
+            return  # Already cleaned up (e.g. by a failed send)
+
         self.active_connections.discard(websocket)
+        self._send_queues.pop(websocket, None)
+        sender = self._senders.pop(websocket, None)
+        if sender:
+            sender.cancel()
         logger.info(f"LoRa WebSocket client disconnected. Remaining: {len(self.active_connections)}")
 
         # Stop streaming if no connections remain
@@ -85,6 +110,9 @@ class LoRaWebSocketManager:
 
         self.is_streaming = False
         self.stop_event.set()
+        # The worker may be blocked waiting for LoRa data; wake it so the
+        # join below does not hold up the event loop
+        serial_service.wake_lora_consumer()
 
         if self.stream_thread and self.stream_thread.is_alive():
             self.stream_thread.join(timeout=2.0)
@@ -97,25 +125,27 @@ class LoRaWebSocketManager:
 
         while self.is_streaming and not self.stop_event.is_set():
             try:
-                # Check for LoRa data using the queue-based approach
-                if serial_service.has_lora_data():
-                    lora_data = serial_service.get_lora_data()
-                    if lora_data and self.active_connections:
-                        logger.debug(f"Broadcasting LoRa data: {lora_data}")
-                        # Schedule the broadcast in the main event loop
-                        if self._main_loop and not self._main_loop.is_closed():
-                            future = asyncio.run_coroutine_threadsafe(
-                                self.broadcast(lora_data),
-                                self._main_loop
-                            )
-                            try:
-                                # Wait for the broadcast to complete with timeout
-                                future.result(timeout=1.0)
-                            except Exception as e:
-                                logger.error(f"Error broadcasting LoRa data: {e}")
-
-                # Small delay to prevent excessive CPU usage
-                time.sleep(0.01)  # Reduced delay for more responsive updates
+                # Sleep until the LoRa monitor queues data (or re-check stop);
+                # lines left over from a capped batch go out without waiting
+                if not serial_service.has_lora_data() and not serial_service.wait_for_lora_data(timeout=0.5):
+                    continue
+
+                # Coalesce everything queued since the last wakeup into one frame
+                batch = []
+                while len(batch) < 32 and (lora_data := serial_service.get_lora_data()) is not None:
+                    batch.append(lora_data)
+
+                if batch and self.active_connections:
+                    message = batch[0] if len(batch) == 1 else {"type": "batch", "frames": batch}
+                    logger.debug(f"Broadcasting {len(batch)} LoRa message(s)")
+                    # Schedule the broadcast in the main event loop without waiting
+                    # for it, so a slow client never holds up draining the queue
+                    if self._main_loop and not self._main_loop.is_closed():
+                        future = asyncio.run_coroutine_threadsafe(
+                            self.broadcast(message),
+                            self._main_loop
+                        )
+                        future.add_done_callback(self._log_broadcast_error)
 
             except Exception as e:
                 logger.error(f"Error in LoRa streaming worker: {e}")
@@ -123,44 +153,74 @@ class LoRaWebSocketManager:
 
         logger.info("LoRa streaming worker stopped")
 
+    @staticmethod
+    def _log_broadcast_error(future: concurrent.futures.Future):
+        """Report a failed fire-and-forget broadcast"""
+        if not future.cancelled() and future.exception() is not None:
+            logger.error(f"Error broadcasting LoRa data: {future.exception()}")
+
+    async def _sender(self, websocket: WebSocket, queue: asyncio.Queue):
+        """Write queued frames to one client
+
+        Frames that pile up while a send is in flight are concatenated into a
+        single batch frame, so a burst costs one WebSocket write per client.
+        """
+        try:
+            while True:
+                payloads = [await queue.get()]
+                while not queue.empty():
+                    payloads.append(queue.get_nowait())
+
+                if len(payloads) == 1:
+                    frame = payloads[0]
+                else:
+                    # Payloads are already JSON; splice them without re-encoding
+                    frame = b'{"type":"batch","frames":[' + b','.join(payloads) + b']}'
+
+                await websocket.send_bytes(frame)
+
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Failed to send to WebSocket client: {e}")
+            self.disconnect(websocket)
+
+    def _enqueue(self, websocket: WebSocket, payload: bytes):
+        """Queue a serialized frame for one client's sender task"""
+        queue = self._send_queues.get(websocket)
+        if queue is None:
+            return
+
+        try:
+            queue.put_nowait(payload)
+        except asyncio.QueueFull:
+            logger.warning("WebSocket client is not keeping up, dropping message")
+
     async def broadcast(self, message: Dict[str, Any]):
         """Broadcast message to all connected clients"""
         if not self.active_connections:
             logger.debug("No active connections to broadcast to")
             return
 
-        message_text = json.dumps(message)
-        disconnected = set()
+        # Serialize once; every client's sender gets the same bytes
+        payload = orjson.dumps(message)
 
         logger.debug(f"Broadcasting to {len(self.active_connections)} clients: {message}")
 
-        # Send to all clients
-        for websocket in self.active_connections.copy():
-            try:
-                await websocket.send_text(message_text)
-                logger.debug(f"Successfully sent message to WebSocket client")
-            except Exception as e:
-                logger.warning(f"Failed to send to WebSocket client: {e}")
-                disconnected.add(websocket)
+        for websocket in tuple(self.active_connections):
+            self._enqueue(websocket, payload)
 
-        # Remove disconnected clients
-        for websocket in disconnected:
-            self.disconnect(websocket)
-
-    async def send_to_client(self, websocket: WebSocket, message: Dict[str, Any]):
-        """Send message to specific client"""
-        try:
-            await websocket.send_text(json.dumps(message))
-        except Exception as e:
-            logger.warning(f"Failed to send to specific WebSocket client: {e}")
-            self.disconnect(websocket)
+    async def send_to_client(self, websocket: WebSocket, message: Union[Dict[str, Any], bytes]):
+        """Send message (or an already serialized payload) to specific client"""
+        payload = message if isinstance(message, bytes) else orjson.dumps(message)
+        self._enqueue(websocket, payload)
 
     async def send_command_notification(self, command: str):
         """Notify all clients about a command being sent"""
         await self.broadcast({
             "type": "command_sent",
             "command": command,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": epoch_ms()
         })
 
     async def send_status_update(self, message: str, status_type: str = "info"):
@@ -169,7 +229,7 @@ class LoRaWebSocketManager:
             "type": "status",
             "message": message,
             "status_type": status_type,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": epoch_ms()
         })
 
     async def send_error(self, error_message: str):
@@ -177,21 +237,18 @@ class LoRaWebSocketManager:
         await self.broadcast({
             "type": "error",
             "message": error_message,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": epoch_ms()
         })
 
     async def handle_client_message(self, websocket: WebSocket, data: str):
         """Handle incoming message from client"""
         try:
-            message = json.loads(data)
+            message = orjson.loads(data)
             message_type = message.get("type", "unknown")
 
             if message_type == "ping":
                 # Respond to ping
-                await self.send_to_client(websocket, {
-                    "type": "pong",
-                    "timestamp": datetime.now().isoformat()
-                })
+                await self.send_to_client(websocket, _PONG_FRAME % epoch_ms())
 
             elif message_type == "get_status":
                 # Send current status
@@ -202,17 +259,17 @@ class LoRaWebSocketManager:
                         "device_type": connection_info.device_type,
                         "port": connection_info.port,
                         "status": connection_info.status.value,
-                        "last_seen": connection_info.last_seen.isoformat() if connection_info.last_seen else None
+                        "last_seen": int(connection_info.last_seen.timestamp() * 1000) if connection_info.last_seen else None
                     },
-                    "timestamp": datetime.now().isoformat()
+                    "timestamp": epoch_ms()
                 })
 
             elif message_type == "command":
                 # Handle command from client
                 command = message.get("command", "").strip()
                 if command:
-                    # Send command via serial service
-                    response = serial_service.send_command(command, use_lora=True)
+                    # Send command via serial service; it blocks on the port lock
+                    response = await serial_service.run_on_port(True, serial_service.send_command, command, True)
 
                     # Notify all clients about the command
                     await self.send_command_notification(command)
@@ -223,13 +280,13 @@ class LoRaWebSocketManager:
                             "type": "command_response",
                             "command": command,
                             "response": response,
-                            "timestamp": datetime.now().isoformat()
+                            "timestamp": epoch_ms()
                         })
 
             else:
                 logger.warning(f"Unknown message type from client: {message_type}")
 
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             logger.warning(f"Invalid JSON from WebSocket client: {data}")
         except Exception as e:
             logger.error(f"Error handling client message: {e}")
@@ -269,10 +326,7 @@ async def websocket_lora_terminal_enhanced(websocket: WebSocket):
 
             except asyncio.TimeoutError:
                 # Send ping to keep connection alive
-                await websocket.send_json({
-                    "type": "info",
-                    "timestamp": datetime.now().isoformat()
-                })
+                await lora_websocket_manager.send_to_client(websocket, _KEEPALIVE_FRAME % epoch_ms())
 
     except WebSocketDisconnect:
         logger.info("LoRa WebSocket client disconnected normally")
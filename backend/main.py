@@ -3,16 +3,22 @@ Ground Control Hub (GCH) - Main Application Entry Point
 Stratospheric device management and telemetry system
 """
 
+import asyncio
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 from pathlib import Path
 
 import uvicorn
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 
 from app.api.routes import router
-from app.core.logger import setup_logging
+from app.core.config import settings
+from app.core.logger import setup_logging, shutdown_logging
 
 
 # ------------------------------------------------------------------
@@ -28,13 +34,20 @@ async def lifespan(app: FastAPI):
     # --------------- Startup ---------------
     setup_logging()
 
-    # Create GCH directory structure in the user's home folder
-    gch_dir = Path.home() / "GCH"
-    gch_dir.mkdir(exist_ok=True)
+    # Bounded pool for asyncio.to_thread / aiofiles; serial commands run on
+    # their own per-port workers (serial_service.run_on_port), so they cannot
+    # exhaust it and stall telemetry polling or file I/O
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=settings.io_worker_threads, thread_name_prefix="gch-io")
+    )
+
+    # Create GCH directory structure (defaults to the user's home folder)
+    gch_dir = settings.gch_directory
+    gch_dir.mkdir(parents=True, exist_ok=True)
 
     # Subdirectories for configs, logs, plots, exports
-    (gch_dir / "configs").mkdir(exist_ok=True)
-    (gch_dir / "logs").mkdir(exist_ok=True)
+    settings.configs_dir.mkdir(exist_ok=True)
+    settings.logs_dir.mkdir(exist_ok=True)
     (gch_dir / "plots").mkdir(exist_ok=True)
     (gch_dir / "exports").mkdir(exist_ok=True)
 
@@ -45,6 +58,7 @@ async def lifespan(app: FastAPI):
     # --------------- Shutdown ---------------
     # Any graceful cleanup logic can be placed here
     print("GCH is shutting down...")
+    shutdown_logging()  # Flush records still queued for the log listener
 
 
 # ------------------------------------------------------------------
@@ -54,6 +68,7 @@ app = FastAPI(
     title="Ground Control Hub",
     description="Stratospheric Device Management System",
     version="0.1.0",
+    default_response_class=ORJSONResponse,  # orjson instead of stdlib json for all routes
     lifespan=lifespan  # modern lifespan handler
 )
 
@@ -66,6 +81,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress HTTP responses (SPA bundle, large JSON lists); WebSockets pass through
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 # Include all API routes
 app.include_router(router, prefix="/api")
 
@@ -81,6 +99,10 @@ if __name__ == "__main__":
         "main:app",
         host="127.0.0.1",
         port=8000,
+        # uvloop (installed by uvicorn[standard]) is not available on Windows
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",  # C HTTP parser, also from uvicorn[standard]
+        ws="websockets",
         reload=True,
         log_level="info"
     )
@@ -1,4 +1,4 @@
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, lazy, Suspense } from 'react';
 import {
   Settings,
   Plane,
@@ -12,15 +12,18 @@ import {
 } from 'lucide-react';
 
 import ConfigurationTab from './components/ConfigurationTab.tsx';
-import FlightTab from './components/FlightTab.tsx';
-import TestsTab from './components/TestsTab.tsx';
-import LoRaTab from './components/LoraTab.tsx';
-import AnalysisTab from './components/AnalysisTab.tsx';
 import StatusBar from './components/StatusBar.tsx';
 import { ConnectionStatus, TelemetryData } from './types';
 import { apiService } from './services/apiService.tsx';
 import './App.css';
 
+// Tabs other than the default one are split into separate chunks and
+// only downloaded the first time the user opens them
+const FlightTab = lazy(() => import('./components/FlightTab.tsx'));
+const TestsTab = lazy(() => import('./components/TestsTab.tsx'));
+const LoRaTab = lazy(() => import('./components/LoraTab.tsx'));
+const AnalysisTab = lazy(() => import('./components/AnalysisTab.tsx'));
+
 type Tab = 'configuration' | 'flight' | 'tests' | 'lora' | 'analysis';
 
 const App: React.FC = () => {
@@ -186,7 +189,9 @@ const App: React.FC = () => {
 
       {/* Main Content */}
       <main className="flex-1 p-6">
-        {renderTabContent()}
+        <Suspense fallback={<div className="text-gray-400">Loading...</div>}>
+          {renderTabContent()}
+        </Suspense>
       </main>
 
       {/* Status Bar */}
@@ -35,7 +35,13 @@ interface WebSocketMessage {
   response?: string;
   message?: string;
   command?: string;
-  timestamp: string;
+  timestamp: number;  // Unix epoch milliseconds
+}
+
+// Several queued messages coalesced by the server into one frame (may nest)
+interface WebSocketBatch {
+  type: 'batch';
+  frames: Array<WebSocketMessage | WebSocketBatch>;
 }
 
 interface LoRaDevice {
@@ -145,6 +151,9 @@ const LoRaTab: React.FC<LoRaTabProps> = ({
       const wsUrl = `${process.env.REACT_APP_WS_PROTOCOL}://${process.env.REACT_APP_API_HOST}/api/ws/lora-terminal`;
 
       websocketRef.current = new WebSocket(wsUrl);
+      // Terminal frames are sent as binary UTF-8 JSON
+      websocketRef.current.binaryType = 'arraybuffer';
+      const decoder = new TextDecoder();
       websocketRef.current.onopen = () => {
         setWsConnected(true);
         setWsStatus('connected');
@@ -155,13 +164,20 @@ const LoRaTab: React.FC<LoRaTabProps> = ({
       };
 
       websocketRef.current.onmessage = (event) => {
+        const text = typeof event.data === 'string' ? event.data : decoder.decode(event.data);
         try {
-          const data: WebSocketMessage = JSON.parse(event.data);
-          handleWebSocketMessage(data);
+          const dispatch = (data: WebSocketMessage | WebSocketBatch) => {
+            if (data.type === 'batch') {
+              data.frames.forEach(dispatch);
+            } else {
+              handleWebSocketMessage(data);
+            }
+          };
+          dispatch(JSON.parse(text));
         } catch (error) {
           console.warn('Failed to parse WebSocket message:', error);
           // Handle plain text messages as fallback
-          addTerminalMessage(event.data, 'response');
+          addTerminalMessage(text, 'response');
         }
       };
 
@@ -367,7 +383,8 @@ const LoRaTab: React.FC<LoRaTabProps> = ({
     addTerminalMessage('Scanning for LoRa Link devices...', 'info');
 
     try {
-      const devices = await apiService.scanDevices();
+      // A user-requested scan should see newly plugged-in devices
+      const devices = await apiService.scanDevices(true);
       const ports = devices.lora_link || [];
       setAvailablePorts(ports);
 
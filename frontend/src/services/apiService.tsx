@@ -26,8 +26,10 @@ class ApiService {
   }
 
   // Device management
-  async scanDevices(): Promise<{ device: string[], lora_link: string[] }> {
-    const response = await axios.get(`${this.baseURL}/devices/scan`);
+  async scanDevices(refresh = false): Promise<{ device: string[], lora_link: string[] }> {
+    const response = await axios.get(`${this.baseURL}/devices/scan`, {
+      params: { refresh }
+    });
     return response.data;
   }
 
@@ -129,10 +131,14 @@ class ApiService {
   createTelemetryWebSocket(onMessage: (data: any) => void, onError?: (error: Event) => void): WebSocket {
     const wsUrl = `${API_BASE_URL.replace('http', 'ws')}/api/ws/telemetry`;
     const ws = new WebSocket(wsUrl);
+    // Telemetry frames are sent as binary UTF-8 JSON
+    ws.binaryType = 'arraybuffer';
+    const decoder = new TextDecoder();
 
     ws.onmessage = (event) => {
       try {
-        const data = JSON.parse(event.data);
+        const text = typeof event.data === 'string' ? event.data : decoder.decode(event.data);
+        const data = JSON.parse(text);
         onMessage(data);
       } catch (error) {
         console.error('Failed to parse WebSocket message:', error);